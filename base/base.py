@@ -1,16 +1,19 @@
 import gpiod
+from datetime import timedelta
 from enum import Enum
-from .utils import is_gpiod_v2
+from functools import partial
+from . import mmap_backend
+from .utils import IS_V2, get_chip
 
 class Pull(Enum):
     """
     Classe énumérée pour les résistances de tirage (pull-up, pull-down, none).
-    
+
     Arguments:
         UP (int): Résistance de tirage vers le haut (pull-up).
         DOWN (int): Résistance de tirage vers le bas (pull-down).
         NONE (int): Aucune résistance de tirage.
-    
+
     Returns:
         Pull: Une instance de la classe Pull représentant le type de résistance de tirage.
     """
@@ -18,151 +21,231 @@ class Pull(Enum):
     DOWN = 2
     NONE = 3
 
-class PinIn:
+# LineSettings pré-construits à l'import (gpiod v2) : les configurations
+# sans détection de fronts sont en nombre fini, inutile d'en allouer une
+# nouvelle à chaque broche.
+if IS_V2:
+    _LS_INPUT = {
+        Pull.UP: gpiod.LineSettings(direction=gpiod.LineDirection.INPUT,
+                                    bias=gpiod.LineBias.PULL_UP),
+        Pull.DOWN: gpiod.LineSettings(direction=gpiod.LineDirection.INPUT,
+                                      bias=gpiod.LineBias.PULL_DOWN),
+        Pull.NONE: gpiod.LineSettings(direction=gpiod.LineDirection.INPUT,
+                                      bias=gpiod.LineBias.DISABLED),
+    }
+    _LS_OUTPUT_0 = gpiod.LineSettings(direction=gpiod.LineDirection.OUTPUT,
+                                      output_value=0)
+    _LS_OUTPUT_1 = gpiod.LineSettings(direction=gpiod.LineDirection.OUTPUT,
+                                      output_value=1)
+else:
+    _LS_INPUT = None
+    _LS_OUTPUT_0 = None
+    _LS_OUTPUT_1 = None
+
+class _PinInBase:
     """
     Classe pour gérer une broche GPIO en entrée.
-    Code compatible avec gpiod version 1 et 2.
-    
+
+    L'implémentation v1 ou v2 de gpiod est choisie une fois pour toutes à
+    l'import du module (voir PinIn en bas de fichier) : read(),
+    wait_for_edge() et close() sont spécialisés, sans branchement par appel.
+
     Arguments:
         pin (int): Numéro de la broche GPIO.
         chip (str): Nom du chip GPIO (par défaut "gpiochip0").
         pull (Pull): Type de résistance de tirage (Pull.UP, Pull.DOWN, Pull.NONE).
     """
-    def __init__(self, pin, chip="gpiochip0", pull=Pull.NONE):
+    def __str__(self):
+        """
+        Représentation en chaîne de la broche GPIO.
+
+        Arguments:
+            None
+
+        Returns:
+            str: Chaîne représentant l'état de la broche GPIO.
+
+        """
+        return f"Pin {self.pin} = {self.read()}"
+
+    def __repr__(self):
+        """
+        Représentation en chaîne de la broche GPIO.
+
+        Arguments:
+            None
+
+        Returns:
+            str: Chaîne représentant l'état de la broche GPIO.
+
+        """
+        return f"PinIn(chip='{self.chip_name}', pin={self.pin}, pull={self.pull})"
+
+class _PinInV2(_PinInBase):
+    """Implémentation PinIn pour gpiod version 2."""
+    def __init__(self, pin, chip="gpiochip0", pull=Pull.NONE, edges=False, debounce=0.0):
         """
         Constructeur de la classe PinIn.
         Arguments:
             pin (int): Numéro de la broche GPIO.
             chip (str): Nom du chip GPIO (par défaut "gpiochip0").
             pull (Pull): Type de résistance de tirage (Pull.UP, Pull.DOWN, Pull.NONE).
+            edges (bool): Active la détection de fronts pour wait_for_edge().
+            debounce (float): Période de debounce filtrée par le noyau, en
+                secondes (gpiod v2 uniquement, avec edges=True).
         """
         self.pin = pin
         self.chip_name = chip
         self.pull = pull
+        self.edges = edges
 
-        if is_gpiod_v2():
+        if edges:
             if pull == Pull.UP:
                 bias = gpiod.LineBias.PULL_UP
             elif pull == Pull.DOWN:
                 bias = gpiod.LineBias.PULL_DOWN
             else:
                 bias = gpiod.LineBias.DISABLED
-
-            self.chip = gpiod.Chip(self.chip_name)
-            self.request = self.chip.request_lines(
-                consumer="gpiodzero",
-                config={self.pin: gpiod.LineSettings(
-                    direction=gpiod.LineDirection.INPUT,
-                    bias=bias
-                )}
+            settings = gpiod.LineSettings(
+                direction=gpiod.LineDirection.INPUT,
+                bias=bias,
+                edge_detection=gpiod.LineEdge.BOTH,
+                debounce_period=timedelta(seconds=debounce)
             )
         else:
-            self.chip = gpiod.Chip(self.chip_name)
-            self.line = self.chip.get_line(self.pin)
-            self.line.request(
-                consumer="gpiodzero",
-                type=gpiod.LINE_REQ_DIR_IN
-            )
+            settings = _LS_INPUT[pull]
+
+        self.chip = get_chip(self.chip_name)
+        self.request = self.chip.request_lines(
+            consumer="gpiodzero",
+            config={self.pin: settings}
+        )
 
     def read(self) -> int:
         """
         Lit la valeur de la broche GPIO.
-        
+
         Arguments:
             None
-            
+
         Returns:
             int: Valeur lue sur la broche GPIO (0 ou 1).
         """
-        if is_gpiod_v2():
-            return self.request.get_value(self.pin)
-        return self.line.get_value()
+        return self.request.get_value(self.pin)
+
+    def wait_for_edge(self, timeout=1.0):
+        """
+        Attend un front (montant ou descendant) sur la broche.
+
+        Le thread dort dans le noyau jusqu'au front ou au timeout : aucune
+        scrutation. Nécessite edges=True à la construction.
+
+        Arguments:
+            timeout (float): Attente maximale en secondes.
+
+        Returns:
+            bool: True si un front s'est produit, False en cas de timeout.
+        """
+        if not self.request.wait_edge_events(timeout):
+            return False
+        self.request.read_edge_events()
+        return True
 
     def close(self):
         """
         Libère la broche GPIO.
-        
+
         Arguments:
             None
-            
+
         Returns:
             None
         """
-        if is_gpiod_v2():
-            self.request.release()
-        else:
-            self.line.release()
+        self.request.release()
 
-    def __str__(self):
+class _PinInV1(_PinInBase):
+    """Implémentation PinIn pour gpiod version 1."""
+    def __init__(self, pin, chip="gpiochip0", pull=Pull.NONE, edges=False, debounce=0.0):
         """
-        Représentation en chaîne de la broche GPIO.
-        
+        Constructeur de la classe PinIn.
+        Arguments:
+            pin (int): Numéro de la broche GPIO.
+            chip (str): Nom du chip GPIO (par défaut "gpiochip0").
+            pull (Pull): Type de résistance de tirage (Pull.UP, Pull.DOWN, Pull.NONE).
+            edges (bool): Active la détection de fronts pour wait_for_edge().
+            debounce (float): Ignoré en v1 (pas de debounce noyau).
+        """
+        self.pin = pin
+        self.chip_name = chip
+        self.pull = pull
+        self.edges = edges
+
+        self.chip = get_chip(self.chip_name)
+        self.line = self.chip.get_line(self.pin)
+        self.line.request(
+            consumer="gpiodzero",
+            type=gpiod.LINE_REQ_EV_BOTH_EDGES if edges else gpiod.LINE_REQ_DIR_IN
+        )
+
+    def read(self) -> int:
+        """
+        Lit la valeur de la broche GPIO.
+
         Arguments:
             None
-        
+
         Returns:
-            str: Chaîne représentant l'état de la broche GPIO.
-            
+            int: Valeur lue sur la broche GPIO (0 ou 1).
         """
-        return f"Pin {self.pin} = {self.read()}"
+        return self.line.get_value()
 
-    def __repr__(self):
+    def wait_for_edge(self, timeout=1.0):
+        """
+        Attend un front (montant ou descendant) sur la broche.
+
+        Le thread dort dans le noyau jusqu'au front ou au timeout : aucune
+        scrutation. Nécessite edges=True à la construction.
+
+        Arguments:
+            timeout (float): Attente maximale en secondes.
+
+        Returns:
+            bool: True si un front s'est produit, False en cas de timeout.
         """
-        Représentation en chaîne de la broche GPIO. 
-        
+        sec = int(timeout)
+        nsec = int((timeout - sec) * 1e9)
+        if not self.line.event_wait(sec=sec, nsec=nsec):
+            return False
+        self.line.event_read()
+        return True
+
+    def close(self):
+        """
+        Libère la broche GPIO.
+
         Arguments:
             None
 
         Returns:
-            str: Chaîne représentant l'état de la broche GPIO.
-            
+            None
         """
-        return f"PinIn(chip='{self.chip_name}', pin={self.pin}, pull={self.pull})"
+        self.line.release()
 
 # ----------Fin de la classe PinIn et de la classe PinOut----------
 
-class PinOut:
+class _PinOutBase:
     """
     Classe pour gérer une broche GPIO en sortie.
-    Code compatible avec gpiod version 1 et 2.
-    
+
+    L'implémentation v1 ou v2 de gpiod est choisie une fois pour toutes à
+    l'import du module (voir PinOut en bas de fichier) : write() et close()
+    sont spécialisés, sans branchement par appel.
+
     Arguments:
         pin (int): Numéro de la broche GPIO.
         chip (str): Nom du chip GPIO (par défaut "gpiochip0").
-        __state (int): Valeur initiale de la broche (0 ou 1).
+        _state (int): Valeur initiale de la broche (0 ou 1).
     """
-    def __init__(self, pin, chip="gpiochip0", initial_value=0):
-        """
-        Constructeur de la classe PinOut.
-        
-        Arguments:
-            pin (int): Numéro de la broche GPIO.
-            chip (str): Nom du chip GPIO (par défaut "gpiochip0").
-            initial_value (int): Valeur initiale de la broche (0 ou 1).
-        """
-        self.pin = pin
-        self.chip_name = chip
-        self.__state = 1 if initial_value else 0
-
-        # Configuration de la broche en sortie selon la version de gpiod
-        if is_gpiod_v2():
-            self.chip = gpiod.Chip(self.chip_name)
-            self.request = self.chip.request_lines(
-                consumer="gpiodzero",
-                config={self.pin: gpiod.LineSettings(
-                    direction=gpiod.LineDirection.OUTPUT,
-                    output_value=self.__state
-                )}
-            )
-        else:
-            self.chip = gpiod.Chip(self.chip_name)
-            self.line = self.chip.get_line(self.pin)
-            self.line.request(
-                consumer="gpiodzero",
-                type=gpiod.LINE_REQ_DIR_OUT,
-                default_vals=[self.__state]
-            )
-    
     def write(self, value: int):
         """
         Écrit une valeur sur la broche GPIO.
@@ -174,57 +257,133 @@ class PinOut:
             None
         """
         value = 1 if value else 0
-        self.__state = value
-        if is_gpiod_v2():
-            self.request.set_value(self.pin, value)
-        else:
-            self.line.set_value(value)
-    
+        self._state = value
+        self._write_impl(value)
+
     @property
     def state(self):
-        return self.__state
+        return self._state
 
-    
-    def close(self):
+    def __str__(self):
         """
-        Libère la broche GPIO.y
-        
+        Représentation en chaîne de la broche GPIO.
+
         Arguments:
             None
-            
+
         Returns:
-            None
+            str: Chaîne représentant l'état de la broche GPIO.
+
         """
-        if is_gpiod_v2():
-            self.request.release()
-        else:
-            self.line.release()
+        return f"Pin {self.pin} = {self._state}"
 
-    def __str__(self):
+    def __repr__(self):
         """
         Représentation en chaîne de la broche GPIO.
-        
+
         Arguments:
             None
-        
+
         Returns:
             str: Chaîne représentant l'état de la broche GPIO.
-            
+
         """
-        return f"Pin {self.pin} = {self.__state}"
+        return f"PinOut(chip='{self.chip_name}', pin={self.pin}, value={self._state})"
 
-    def __repr__(self):
+class _PinOutV2(_PinOutBase):
+    """Implémentation PinOut pour gpiod version 2."""
+    def __init__(self, pin, chip="gpiochip0", initial_value=0, use_mmap=False):
         """
-        Représentation en chaîne de la broche GPIO.
-        
+        Constructeur de la classe PinOut.
+
+        Arguments:
+            pin (int): Numéro de la broche GPIO.
+            chip (str): Nom du chip GPIO (par défaut "gpiochip0").
+            initial_value (int): Valeur initiale de la broche (0 ou 1).
+            use_mmap (bool): Écrit via les registres de /dev/gpiomem
+                (Raspberry Pi, BCM2835) au lieu des ioctl gpiod.
+        """
+        self.pin = pin
+        self.chip_name = chip
+        self._state = 1 if initial_value else 0
+
+        self.chip = get_chip(self.chip_name)
+        self.request = self.chip.request_lines(
+            consumer="gpiodzero",
+            config={self.pin: _LS_OUTPUT_1 if self._state else _LS_OUTPUT_0}
+        )
+
+        # Implémentation liée une fois pour toutes : write() ne rebranche
+        # plus sur le backend à chaque appel.
+        if use_mmap and mmap_backend.available():
+            # Raccourci MMIO : la ligne reste réservée et configurée en
+            # sortie par gpiod, mais chaque écriture est un simple accès
+            # registre au lieu d'un ioctl.
+            self._write_impl = partial(mmap_backend.write, self.pin)
+        else:
+            self._write_impl = partial(self.request.set_value, self.pin)
+
+    def close(self):
+        """
+        Libère la broche GPIO.
+
         Arguments:
             None
-        
+
         Returns:
-            str: Chaîne représentant l'état de la broche GPIO.
-            
+            None
+        """
+        self.request.release()
+
+class _PinOutV1(_PinOutBase):
+    """Implémentation PinOut pour gpiod version 1."""
+    def __init__(self, pin, chip="gpiochip0", initial_value=0, use_mmap=False):
+        """
+        Constructeur de la classe PinOut.
+
+        Arguments:
+            pin (int): Numéro de la broche GPIO.
+            chip (str): Nom du chip GPIO (par défaut "gpiochip0").
+            initial_value (int): Valeur initiale de la broche (0 ou 1).
+            use_mmap (bool): Écrit via les registres de /dev/gpiomem
+                (Raspberry Pi, BCM2835) au lieu des ioctl gpiod.
+        """
+        self.pin = pin
+        self.chip_name = chip
+        self._state = 1 if initial_value else 0
+
+        self.chip = get_chip(self.chip_name)
+        self.line = self.chip.get_line(self.pin)
+        self.line.request(
+            consumer="gpiodzero",
+            type=gpiod.LINE_REQ_DIR_OUT,
+            default_vals=[self._state]
+        )
+
+        # Implémentation liée une fois pour toutes : write() ne rebranche
+        # plus sur le backend à chaque appel.
+        if use_mmap and mmap_backend.available():
+            self._write_impl = partial(mmap_backend.write, self.pin)
+        else:
+            self._write_impl = self.line.set_value
+
+    def close(self):
+        """
+        Libère la broche GPIO.
+
+        Arguments:
+            None
+
+        Returns:
+            None
         """
-        return f"PinOut(chip='{self.chip_name}', pin={self.pin}, value={self.__state})"
+        self.line.release()
+
+# Sélection de l'implémentation à l'import : la version de gpiod ne change
+# pas en cours d'exécution, PinIn et PinOut sont directement les classes
+# spécialisées.
+PinIn = _PinInV2 if IS_V2 else _PinInV1
+PinOut = _PinOutV2 if IS_V2 else _PinOutV1
 
 if __name__ == "__main__":
-    print("Ce module ne doit pas être exécuté directement.")    
+    print("Ce module ne doit pas être exécuté directement.")
@@ -0,0 +1,99 @@
+import ctypes
+import mmap
+import os
+
+# Accès direct aux registres GPIO du BCM2835 via /dev/gpiomem (Raspberry
+# Pi jusqu'au Pi 4). Écrire GPSET0/GPCLR0 bascule une broche en une seule
+# écriture MMIO (~20 ns) au lieu d'un aller-retour ioctl (~1-3 µs) : utile
+# pour le PWM logiciel rapide. La réservation et la direction de la ligne
+# restent gérées par gpiod ; seules les écritures passent par ici.
+_GPIO_LEN = 0xB4
+_GPSET0 = 0x1C // 4  # index dans le bloc, en mots de 32 bits
+_GPCLR0 = 0x28 // 4
+
+_registers = None
+
+def available():
+    """
+    Indique si le raccourci /dev/gpiomem est utilisable sur cette machine.
+
+    Le mapping est créé ici, au moment du choix du backend : un échec
+    (droits insuffisants, périphérique absent) fait retomber l'appelant
+    sur les écritures gpiod au lieu d'exploser plus tard dans le thread
+    PWM à la première écriture.
+
+    Arguments:
+        None
+
+    Returns:
+        bool: True si les registres de /dev/gpiomem sont mappés.
+    """
+    try:
+        _get_registers()
+    except OSError:
+        return False
+    return True
+
+def _get_registers():
+    """
+    Mappe le bloc de registres GPIO au premier appel puis le réutilise.
+
+    Arguments:
+        None
+
+    Returns:
+        ctypes.Array: Vue c_uint32 sur les registres GPIO.
+    """
+    global _registers
+    if _registers is None:
+        fd = os.open("/dev/gpiomem", os.O_RDWR | os.O_SYNC)
+        try:
+            mem = mmap.mmap(fd, _GPIO_LEN, mmap.MAP_SHARED,
+                            mmap.PROT_READ | mmap.PROT_WRITE)
+        finally:
+            os.close(fd)
+        _registers = (ctypes.c_uint32 * (_GPIO_LEN // 4)).from_buffer(mem)
+    return _registers
+
+def set_hi(pin):
+    """
+    Met la broche à l'état haut par écriture du registre GPSET0.
+
+    Arguments:
+        pin (int): Numéro de la broche GPIO (numérotation BCM).
+
+    Returns:
+        None
+    """
+    _get_registers()[_GPSET0 + (pin >> 5)] = 1 << (pin & 31)
+
+def set_lo(pin):
+    """
+    Met la broche à l'état bas par écriture du registre GPCLR0.
+
+    Arguments:
+        pin (int): Numéro de la broche GPIO (numérotation BCM).
+
+    Returns:
+        None
+    """
+    _get_registers()[_GPCLR0 + (pin >> 5)] = 1 << (pin & 31)
+
+def write(pin, value):
+    """
+    Écrit une valeur sur la broche sans passer par le noyau.
+
+    Arguments:
+        pin (int): Numéro de la broche GPIO (numérotation BCM).
+        value (int): Valeur à écrire (0 ou 1).
+
+    Returns:
+        None
+    """
+    if value:
+        set_hi(pin)
+    else:
+        set_lo(pin)
+
+if __name__ == "__main__":
+    print("Ce module ne doit pas être exécuté directement.")
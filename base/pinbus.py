@@ -0,0 +1,125 @@
+import gpiod
+from .base import _LS_OUTPUT_0
+from .utils import IS_V2, get_chip
+
+
+class PinBus:
+    """
+    Groupe de broches de sortie piloté par une seule requête gpiod.
+
+    Pour les animations multi-broches (LEDRGB, chenillard, matrice...),
+    les écritures peuvent être préparées avec set() puis émises d'un bloc
+    par flush() : un seul appel set_values — donc un seul ioctl — quel
+    que soit le nombre de broches modifiées, et toutes les lignes
+    changent d'état au même instant.
+
+    Arguments:
+        pins (list): Numéros des broches GPIO du groupe.
+        chip (str): Nom du chip GPIO (par défaut "gpiochip0").
+    """
+
+    def __init__(self, pins, chip="gpiochip0"):
+        """
+        Constructeur de la classe PinBus.
+
+        Arguments:
+            pins (list): Numéros des broches GPIO du groupe.
+            chip (str): Nom du chip GPIO (par défaut "gpiochip0").
+        """
+        self.pins = tuple(pins)
+        self.chip_name = chip
+        self.chip = get_chip(chip)
+
+        if IS_V2:
+            self.request = self.chip.request_lines(
+                consumer="gpiodzero",
+                config={pin: _LS_OUTPUT_0 for pin in self.pins}
+            )
+            self.lines = None
+        else:
+            self.lines = self.chip.get_lines(list(self.pins))
+            self.lines.request(
+                consumer="gpiodzero",
+                type=gpiod.LINE_REQ_DIR_OUT,
+                default_vals=[0] * len(self.pins)
+            )
+            self.request = None
+
+        # État courant des lignes, nécessaire en v1 où chaque écriture
+        # fournit toutes les valeurs d'un bloc.
+        self.__state = {pin: 0 for pin in self.pins}
+        self.__pending = {}
+
+    def set(self, pin, value):
+        """
+        Prépare une écriture sans l'émettre (voir flush).
+
+        Arguments:
+            pin (int): Numéro de la broche GPIO.
+            value (int): Valeur à écrire (0 ou 1).
+
+        Returns:
+            None
+        """
+        self.__pending[pin] = 1 if value else 0
+
+    def flush(self):
+        """
+        Émet toutes les écritures préparées en un seul appel gpiod.
+
+        Arguments:
+            None
+
+        Returns:
+            None
+        """
+        if self.__pending:
+            self.write(self.__pending)
+            self.__pending = {}
+
+    def write(self, values):
+        """
+        Écrit immédiatement plusieurs broches en un seul appel gpiod.
+
+        Arguments:
+            values (dict): Correspondance broche -> valeur (0 ou 1).
+
+        Returns:
+            None
+        """
+        self.__state.update(values)
+        if self.request is not None:
+            self.request.set_values(values)
+        else:
+            self.lines.set_values([self.__state[pin] for pin in self.pins])
+
+    def close(self):
+        """
+        Libère les broches du groupe.
+
+        Arguments:
+            None
+
+        Returns:
+            None
+        """
+        if self.request is not None:
+            self.request.release()
+        else:
+            self.lines.release()
+
+    def __repr__(self):
+        """
+        Représentation en chaîne du groupe de broches.
+
+        Arguments:
+            None
+
+        Returns:
+            str: Chaîne représentant le groupe de broches.
+        """
+        return f"PinBus(chip='{self.chip_name}', pins={list(self.pins)})"
+
+
+if __name__ == "__main__":
+    print("Ce module ne doit pas être exécuté directement.")
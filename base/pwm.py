@@ -1,20 +1,36 @@
+import os
 import threading
 import time
+from functools import partial
 from .base import PinOut
-from .utils import is_gpiod_v2
+from .utils import sleep_until
+
+# Correspondance (chip, broche) -> (pwmchip sysfs, canal) pour les broches
+# câblées sur un contrôleur PWM matériel (Raspberry Pi : GPIO 12/13/18/19).
+_HW_PWM_MAP = {
+    ("gpiochip0", 12): ("pwmchip0", 0),
+    ("gpiochip0", 13): ("pwmchip0", 1),
+    ("gpiochip0", 18): ("pwmchip0", 2),
+    ("gpiochip0", 19): ("pwmchip0", 3),
+}
 
 class PWM(PinOut):
     """
     Classe PWM pour gérer les sorties en modulation de largeur d'impulsion.
     Hérite de PinOut. Compatible gpiod v1 et v2.
-    
+
+    Si la broche correspond à un canal PWM matériel (_HW_PWM_MAP), le signal
+    est généré par le contrôleur du SoC via /sys/class/pwm : aucun thread,
+    aucune charge CPU, aucune gigue. Sinon, un thread Python génère le PWM
+    en logiciel comme avant.
+
     Arguments:
         pin (int): Numéro de la broche GPIO.
         chip (str): Nom du chip GPIO (défaut "gpiochip0").
         frequency (int): Fréquence du PWM en Hz (défaut 1000).
     """
 
-    def __init__(self, pin, chip="gpiochip0", frequency=1000):
+    def __init__(self, pin, chip="gpiochip0", frequency=1000, use_mmap=False):
         """
         Constructeur de la classe PWM.
 
@@ -22,13 +38,84 @@ class PWM(PinOut):
             pin (int): Numéro de la broche GPIO.
             chip (str): Nom du chip GPIO.
             frequency (int): Fréquence du PWM en Hz.
+            use_mmap (bool): Écrit les fronts logiciels via les registres
+                de /dev/gpiomem (voir PinOut) au lieu des ioctl gpiod.
         """
-        super().__init__(pin=pin, chip=chip, initial_value=0)
+        super().__init__(pin=pin, chip=chip, initial_value=0, use_mmap=use_mmap)
         self.__frequency = frequency
         self.__duty_value = 0
         self.__duty_max = 255  # valeur par défaut duty_cycle_8
+        # Duty normalisé en 16 bits dès l'écriture : le thread PWM n'a plus
+        # qu'une multiplication entière et un décalage par front.
+        self._duty_norm = 0
+        # Incrémenté par chaque setter : le thread ne recharge fréquence et
+        # duty que quand ce compteur bouge.
+        self._params_version = 0
         self.__running = False
         self.__thread = None
+        # Signale au thread PWM qu'un setter a changé le duty cycle
+        # (réveille aussi le sommeil long des duty constants).
+        self.__duty_changed = threading.Event()
+        # Signal d'arrêt coopératif : stop() interrompt immédiatement les
+        # attentes du thread au lieu de laisser finir le sleep en cours.
+        self.__stop_evt = threading.Event()
+
+        # Descripteurs sysfs du canal PWM matériel, gardés ouverts :
+        # un open() par écriture coûterait plus cher que l'écriture elle-même.
+        self.__hw = False
+        self.__period_fd = None
+        self.__duty_fd = None
+        self.__enable_fd = None
+        if (chip, pin) in _HW_PWM_MAP:
+            try:
+                self.__open_hw_pwm(*_HW_PWM_MAP[(chip, pin)])
+                self.__hw = True
+            except OSError:
+                # Canal indisponible (droits, overlay absent...) :
+                # repli sur le PWM logiciel.
+                self.__hw = False
+
+    def __open_hw_pwm(self, pwmchip, channel):
+        """
+        Exporte le canal PWM matériel si besoin et ouvre les fichiers
+        period / duty_cycle / enable.
+
+        Arguments:
+            pwmchip (str): Nom du contrôleur dans /sys/class/pwm.
+            channel (int): Numéro du canal sur ce contrôleur.
+
+        Returns:
+            None
+        """
+        base = f"/sys/class/pwm/{pwmchip}"
+        channel_dir = f"{base}/pwm{channel}"
+        if not os.path.isdir(channel_dir):
+            with open(f"{base}/export", "w") as f:
+                f.write(str(channel))
+        self.__period_fd = os.open(f"{channel_dir}/period", os.O_WRONLY)
+        self.__duty_fd = os.open(f"{channel_dir}/duty_cycle", os.O_WRONLY)
+        self.__enable_fd = os.open(f"{channel_dir}/enable", os.O_WRONLY)
+
+    def __hw_apply(self):
+        """
+        Pousse la fréquence et le duty cycle courants vers le canal matériel.
+
+        Arguments:
+            None
+
+        Returns:
+            None
+        """
+        period_ns = int(1e9 / self.__frequency)
+        # Division par 65535 (et non >> 16) : exacte aux deux bornes,
+        # duty_ns atteint period_ns à 100 % au lieu de s'arrêter juste
+        # en dessous et de laisser un creux de quelques ns par période.
+        duty_ns = period_ns * self._duty_norm // 65535
+        # Le noyau exige duty_cycle <= period : on remet le duty à zéro
+        # avant de toucher à la période.
+        os.pwrite(self.__duty_fd, b"0", 0)
+        os.pwrite(self.__period_fd, b"%d" % period_ns, 0)
+        os.pwrite(self.__duty_fd, b"%d" % duty_ns, 0)
 
     @property
     def frequency(self):
@@ -55,6 +142,35 @@ class PWM(PinOut):
             None
         """
         self.__frequency = value
+        self._params_version += 1
+        if self.__hw and self.__running:
+            self.__hw_apply()
+
+    def set_duty(self, value=None, bits=8):
+        """
+        Getter / Setter du duty cycle dans une résolution donnée.
+
+        La valeur est normalisée en 16 bits dès l'écriture (_duty_norm) :
+        le thread PWM calcule le temps haut par multiplication entière et
+        décalage, sans division flottante par front.
+
+        Arguments:
+            value (int): Valeur du duty cycle (0 à 2**bits - 1), ou None
+                pour lire la valeur actuelle.
+            bits (int): Résolution en bits (8, 10, 12 ou 16).
+
+        Returns:
+            int: Valeur actuelle du duty cycle si value=None.
+        """
+        self.__duty_max = (1 << bits) - 1
+        if value is None:
+            return self.__duty_value
+        self.__duty_value = max(0, min(value, self.__duty_max))
+        self._duty_norm = (self.__duty_value * 65535) // self.__duty_max
+        self._params_version += 1
+        self.__duty_changed.set()
+        if self.__hw and self.__running:
+            self.__hw_apply()
 
     def duty_cycle_8(self, value=None):
         """
@@ -66,10 +182,7 @@ class PWM(PinOut):
         Returns:
             int: Valeur actuelle du duty cycle si value=None.
         """
-        self.__duty_max = 255
-        if value is None:
-            return self.__duty_value
-        self.__duty_value = max(0, min(value, self.__duty_max))
+        return self.set_duty(value, bits=8)
 
     def duty_cycle_10(self, value=None):
         """
@@ -81,10 +194,7 @@ class PWM(PinOut):
         Returns:
             int: Valeur actuelle du duty cycle si value=None.
         """
-        self.__duty_max = 1023
-        if value is None:
-            return self.__duty_value
-        self.__duty_value = max(0, min(value, self.__duty_max))
+        return self.set_duty(value, bits=10)
 
     def duty_cycle_12(self, value=None):
         """
@@ -96,10 +206,7 @@ class PWM(PinOut):
         Returns:
             int: Valeur actuelle du duty cycle si value=None.
         """
-        self.__duty_max = 4095
-        if value is None:
-            return self.__duty_value
-        self.__duty_value = max(0, min(value, self.__duty_max))
+        return self.set_duty(value, bits=12)
 
     def duty_cycle_16(self, value=None):
         """
@@ -111,23 +218,65 @@ class PWM(PinOut):
         Returns:
             int: Valeur actuelle du duty cycle si value=None.
         """
-        self.__duty_max = 65535
-        if value is None:
-            return self.__duty_value
-        self.__duty_value = max(0, min(value, self.__duty_max))
+        return self.set_duty(value, bits=16)
 
     def __pwm_thread(self):
-        """Thread interne qui génère le PWM non bloquant."""
-        period = 1.0 / self.__frequency
-        while self.__running:
-            on_time = period * (self.__duty_value / self.__duty_max)
-            off_time = period - on_time
-            if on_time > 0:
-                super().write(1)
-                time.sleep(on_time)
-            if off_time > 0:
-                super().write(0)
-                time.sleep(off_time)
+        """
+        Thread interne qui génère le PWM non bloquant.
+
+        Échéancier absolu : chaque front vise un instant monotonic_ns
+        précalculé, donc l'erreur de réveil d'un sleep ne s'accumule pas
+        de cycle en cycle et la fréquence moyenne reste exacte.
+        """
+        # Variables locales : chaque front coûte un appel C, plus aucune
+        # résolution d'attribut ni re-traversée de PinOut.write.
+        set_hi = self._set_hi
+        set_lo = self._set_lo
+        stop_evt = self.__stop_evt
+
+        def wait(deadline_ns):
+            """Attend l'échéance ; True si stop() a été appelé entre-temps."""
+            remaining_ns = deadline_ns - time.monotonic_ns()
+            if remaining_ns > 1_000_000:
+                if stop_evt.wait(timeout=(remaining_ns - 1_000_000) / 1e9):
+                    return True
+            sleep_until(deadline_ns)
+            return False
+
+        ver = -1
+        duty_norm = period_ns = on_ns = off_ns = 0
+        next_on = time.monotonic_ns()
+        while not stop_evt.is_set():
+            v = self._params_version
+            if v != ver:
+                # Paramètres rechargés seulement quand un setter a bougé :
+                # en régime établi, un front ne lit que des locales.
+                duty_norm = self._duty_norm
+                period_ns = int(1e9 / self.__frequency)
+                on_ns = (period_ns * duty_norm) >> 16
+                off_ns = period_ns - on_ns
+                ver = v
+            if duty_norm == 0 or duty_norm == 65535:
+                # Duty constant (LED éteinte ou pleine) : une écriture puis
+                # sommeil jusqu'au prochain changement — plus aucun syscall
+                # tant que rien ne bouge.
+                if duty_norm == 0:
+                    set_lo()
+                else:
+                    set_hi()
+                self.__duty_changed.wait(timeout=1.0)
+                self.__duty_changed.clear()
+                next_on = time.monotonic_ns()
+                continue
+            next_on += period_ns
+            if on_ns > 0:
+                set_hi()
+                if wait(next_on - off_ns):
+                    break
+            if off_ns > 0:
+                set_lo()
+                if wait(next_on):
+                    break
 
     def start(self):
         """
@@ -141,8 +290,19 @@ class PWM(PinOut):
         """
         if not self.__running:
             self.__running = True
-            self.__thread = threading.Thread(target=self.__pwm_thread, daemon=True)
-            self.__thread.start()
+            if self.__hw:
+                # Le contrôleur du SoC génère les fronts : pas de thread.
+                self.__hw_apply()
+                os.pwrite(self.__enable_fd, b"1\n", 0)
+            else:
+                self.__stop_evt.clear()
+                # Écritures pré-liées par-dessus _write_impl : chaque front
+                # du thread se réduit à un appel C sans lookup, quel que
+                # soit le backend (gpiod v1/v2 ou registres mmap).
+                self._set_hi = partial(self._write_impl, 1)
+                self._set_lo = partial(self._write_impl, 0)
+                self.__thread = threading.Thread(target=self.__pwm_thread, daemon=True)
+                self.__thread.start()
 
     def stop(self):
         """
@@ -155,9 +315,16 @@ class PWM(PinOut):
         """
         if self.__running:
             self.__running = False
-            if self.__thread:
-                self.__thread.join()
-            super().write(0)
+            if self.__hw:
+                os.pwrite(self.__enable_fd, b"0\n", 0)
+            else:
+                # Réveille immédiatement le thread, qu'il soit dans une
+                # attente de front ou dans le sommeil des duty constants.
+                self.__stop_evt.set()
+                self.__duty_changed.set()
+                if self.__thread:
+                    self.__thread.join()
+                super().write(0)
 
     def close(self):
         """
@@ -170,6 +337,9 @@ class PWM(PinOut):
             None
         """
         self.stop()
+        for fd in (self.__period_fd, self.__duty_fd, self.__enable_fd):
+            if fd is not None:
+                os.close(fd)
         super().close()
         
     def __str__(self):
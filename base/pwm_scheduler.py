@@ -0,0 +1,197 @@
+import heapq
+import threading
+import time
+from .utils import sleep_until
+
+
+class PWMScheduler:
+    """
+    Ordonnanceur PWM multi-canaux dans un seul thread.
+
+    Chaque canal déclare sa période et son temps haut ; l'ordonnanceur
+    entretient un tas des prochains fronts (échéances monotonic_ns
+    absolues), dort jusqu'au front le plus proche puis écrit tous les
+    fronts arrivés à échéance en un seul appel du bus — un ioctl pour
+    tous les canaux concernés. Un seul thread quel que soit le nombre de
+    canaux : pas de dérive de phase entre eux, pas de contention GIL
+    entre N boucles PWM.
+
+    Arguments:
+        bus (PinBus): Groupe de broches sur lequel écrire les fronts.
+    """
+
+    # Tolérance de regroupement : les fronts à moins de ce délai l'un de
+    # l'autre sont écrits dans le même appel.
+    _COALESCE_NS = 20_000
+
+    def __init__(self, bus):
+        """
+        Constructeur de la classe PWMScheduler.
+
+        Arguments:
+            bus (PinBus): Groupe de broches sur lequel écrire les fronts.
+        """
+        self.bus = bus
+        self._channels = {}  # broche -> [period_ns, on_ns, génération, parqué]
+        self._heap = []      # (échéance_ns, broche, valeur à écrire, génération)
+        # Génération de la chaîne de fronts : retirer puis recréer un canal
+        # invalide les entrées de tas de l'ancienne chaîne, sinon les deux
+        # chaînes se replanifieraient en parallèle à fréquence double.
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._changed = threading.Event()
+        self._running = False
+        self._thread = None
+
+    @property
+    def running(self):
+        """
+        Indique si le thread de l'ordonnanceur tourne.
+
+        Arguments:
+            None
+
+        Returns:
+            bool: True si l'ordonnanceur est démarré.
+        """
+        return self._running
+
+    def set_channel(self, pin, period_ns, on_ns):
+        """
+        Déclare ou met à jour un canal PWM sur une broche du bus.
+
+        Arguments:
+            pin (int): Numéro de la broche GPIO.
+            period_ns (int): Période du canal en nanosecondes.
+            on_ns (int): Temps haut par période en nanosecondes.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            channel = self._channels.get(pin)
+            if channel is not None:
+                # Canal déjà planifié : la chaîne en cours garde sa
+                # génération et prendra les nouveaux paramètres au
+                # prochain front.
+                channel[0] = period_ns
+                channel[1] = on_ns
+                if channel[3]:
+                    # Canal parqué (duty constant) : sa chaîne est morte,
+                    # on en relance une sur la même génération.
+                    channel[3] = False
+                    heapq.heappush(self._heap,
+                                   (time.monotonic_ns(), pin, 1, channel[2]))
+            else:
+                self._generation += 1
+                self._channels[pin] = [period_ns, on_ns, self._generation, False]
+                heapq.heappush(self._heap,
+                               (time.monotonic_ns(), pin, 1, self._generation))
+        self._changed.set()
+
+    def remove_channel(self, pin):
+        """
+        Retire un canal de l'ordonnanceur.
+
+        Arguments:
+            pin (int): Numéro de la broche GPIO.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._channels.pop(pin, None)
+            self._generation += 1  # périme les entrées de tas du canal
+        self._changed.set()
+
+    def start(self):
+        """
+        Démarre le thread de l'ordonnanceur s'il ne tourne pas déjà.
+
+        Arguments:
+            None
+
+        Returns:
+            None
+        """
+        if not self._running:
+            self._running = True
+            self._thread = threading.Thread(target=self._loop, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """
+        Arrête le thread de l'ordonnanceur.
+
+        Arguments:
+            None
+
+        Returns:
+            None
+        """
+        if self._running:
+            self._running = False
+            self._changed.set()
+            if self._thread:
+                self._thread.join()
+
+    def _loop(self):
+        """Thread interne : dort jusqu'au prochain front, écrit d'un bloc."""
+        while self._running:
+            with self._lock:
+                deadline = self._heap[0][0] if self._heap else None
+
+            if deadline is None:
+                self._changed.wait(timeout=0.2)
+                self._changed.clear()
+                continue
+
+            # Attente interruptible jusqu'à ~1 ms de l'échéance (réveil
+            # immédiat sur stop/set_channel), puis échéance absolue exacte.
+            remaining_ns = deadline - time.monotonic_ns()
+            if remaining_ns > 1_000_000:
+                if self._changed.wait(timeout=(remaining_ns - 1_000_000) / 1e9):
+                    self._changed.clear()
+                    continue
+            sleep_until(deadline)
+
+            values = {}
+            now = time.monotonic_ns()
+            with self._lock:
+                while self._heap and self._heap[0][0] <= now + self._COALESCE_NS:
+                    t, pin, value, gen = heapq.heappop(self._heap)
+                    channel = self._channels.get(pin)
+                    if channel is None or channel[2] != gen:
+                        continue  # chaîne périmée (canal retiré ou recréé)
+                    period_ns, on_ns = channel[0], channel[1]
+                    if value == 1:  # front montant du canal
+                        if on_ns <= 0 or on_ns >= period_ns:
+                            # Duty constant (éteint ou plein) : une seule
+                            # écriture puis canal parqué jusqu'au prochain
+                            # set_channel — pas d'ioctl par période à vide.
+                            values[pin] = 0 if on_ns <= 0 else 1
+                            channel[3] = True
+                            continue
+                        values[pin] = 1
+                        heapq.heappush(self._heap, (t + on_ns, pin, 0, gen))
+                        heapq.heappush(self._heap, (t + period_ns, pin, 1, gen))
+                    else:
+                        values[pin] = 0
+            if values:
+                self.bus.write(values)
+
+    def __repr__(self):
+        """
+        Représentation en chaîne de l'ordonnanceur.
+
+        Arguments:
+            None
+
+        Returns:
+            str: Chaîne représentant l'ordonnanceur.
+        """
+        return f"PWMScheduler(bus={self.bus!r}, channels={len(self._channels)})"
+
+
+if __name__ == "__main__":
+    print("Ce module ne doit pas être exécuté directement.")
@@ -1,16 +1,102 @@
+import atexit
+import ctypes
+import ctypes.util
+import errno
+import time
 import gpiod
 
+# Détection faite une seule fois à l'import : la version de gpiod ne change
+# pas en cours d'exécution, inutile de refaire le hasattr à chaque opération.
+IS_V2 = hasattr(gpiod, "LineSettings")
+
 def is_gpiod_v2():
     """
     Vérifie si la version 2 de la bibliothèque gpiod est utilisée.
-    
+
     Arguments:
         Aucun.
-    
+
     Returns:
         bool: True si gpiod version 2 est utilisé, False sinon.
     """
-    return hasattr(gpiod, "LineSettings")
+    return IS_V2
+
+# Un seul handle gpiod.Chip par nom de chip, partagé par toutes les broches :
+# un open de /dev/gpiochipN par processus au lieu d'un par objet.
+_CHIPS = {}
+
+def get_chip(name):
+    """
+    Retourne le handle gpiod.Chip partagé pour ce chip, ouvert au premier
+    appel puis réutilisé.
+
+    Arguments:
+        name (str): Nom du chip GPIO (ex. "gpiochip0").
+
+    Returns:
+        gpiod.Chip: Handle partagé, à ne pas fermer par l'appelant.
+    """
+    chip = _CHIPS.get(name)
+    if chip is None:
+        chip = _CHIPS[name] = gpiod.Chip(name)
+    return chip
+
+@atexit.register
+def _close_chips():
+    """Ferme les chips partagés à la fin du processus."""
+    for chip in _CHIPS.values():
+        chip.close()
+    _CHIPS.clear()
+
+# Marge finie en attente active à la fin de sleep_until (~50 µs) : en dessous
+# de ce délai, time.sleep() coûte plus cher que la boucle.
+_SPIN_NS = 50_000
+
+# clock_nanosleep(CLOCK_MONOTONIC, TIMER_ABSTIME) attend une échéance absolue
+# en un seul appel système, côté C : pas d'attente active, et ctypes relâche
+# le GIL pendant l'appel, donc les autres threads (blink, boutons) tournent
+# librement pendant qu'un PWM attend son prochain front.
+_TIMER_ABSTIME = 1
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+try:
+    _libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    _clock_nanosleep = _libc.clock_nanosleep
+    _clock_nanosleep.argtypes = [ctypes.c_int, ctypes.c_int,
+                                 ctypes.POINTER(_Timespec),
+                                 ctypes.POINTER(_Timespec)]
+    _clock_nanosleep.restype = ctypes.c_int
+except (OSError, AttributeError, TypeError):
+    _clock_nanosleep = None
+
+def sleep_until(deadline_ns):
+    """
+    Attend jusqu'à un instant absolu de l'horloge time.monotonic_ns().
+
+    Contrairement à time.sleep(durée), l'échéance est absolue : l'erreur
+    de réveil d'un cycle ne se reporte pas sur les suivants. Utilise
+    clock_nanosleep(CLOCK_MONOTONIC, TIMER_ABSTIME) de la libc quand elle
+    est disponible, sinon time.sleep() suivi d'une courte attente active.
+
+    Arguments:
+        deadline_ns (int): Échéance absolue en nanosecondes (monotonic_ns).
+
+    Returns:
+        None
+    """
+    if _clock_nanosleep is not None:
+        ts = _Timespec(deadline_ns // 1_000_000_000, deadline_ns % 1_000_000_000)
+        while _clock_nanosleep(time.CLOCK_MONOTONIC, _TIMER_ABSTIME,
+                               ctypes.byref(ts), None) == errno.EINTR:
+            pass
+        return
+    remaining_ns = deadline_ns - time.monotonic_ns() - _SPIN_NS
+    if remaining_ns > 0:
+        time.sleep(remaining_ns / 1e9)
+    while time.monotonic_ns() < deadline_ns:
+        pass
 
 if __name__ == "__main__":
     print("Ce module ne doit pas être exécuté directement.")
\ No newline at end of file
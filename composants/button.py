@@ -1,11 +1,22 @@
-from .base import PinIn, Pull
+from ..base.base import PinIn, Pull
+from ..base.utils import is_gpiod_v2
 import threading
 import time
 
 class Button(PinIn):
-    def __init__(self, pin: int, chip="gpiochip0", pull=Pull.NONE, debounce_time=0.03):
-        super().__init__(pin, chip=chip, pull=pull)
+    # États de la machine à états du thread de surveillance
+    _IDLE, _PRESSED, _WAIT_2ND, _HELD = range(4)
+
+    def __init__(self, pin: int, chip="gpiochip0", pull=Pull.NONE, debounce_time=0.03,
+                 double_click_time=0.3, hold_time=1.0):
+        # Détection de fronts noyau : le thread de surveillance dort dans
+        # poll() au lieu de relire la broche toutes les 5 ms. En gpiod v2
+        # le debounce est aussi fait par le noyau : les rebonds ne
+        # remontent jamais jusqu'à Python.
+        super().__init__(pin, chip=chip, pull=pull, edges=True, debounce=debounce_time)
         self.debounce_time = debounce_time
+        self.double_click_time = double_click_time
+        self.hold_time = hold_time
         self._last_state = self.is_pressed()
         self._running = True
 
@@ -22,20 +33,20 @@ class Button(PinIn):
 
     # --- Méthode pour lire l'état actuel ---
     def is_pressed(self):
-    """
-    Retourne True si le bouton est pressé, False sinon.
-    Gère correctement les pulls (UP / DOWN) et renvoie un bool.
-    """
-    val = self.read()  # lit la valeur physique de la GPIO
-    # Si pull-up : bouton appuyé = 0 (low), relâché = 1 (high)
-    if self.pull == Pull.UP:
-        return val == 0
-    # Si pull-down : bouton appuyé = 1 (high), relâché = 0 (low)
-    elif self.pull == Pull.DOWN:
-        return val == 1
-    # Aucun pull : on renvoie simplement l'état tel quel
-    else:
-        return bool(val)
+        """
+        Retourne True si le bouton est pressé, False sinon.
+        Gère correctement les pulls (UP / DOWN) et renvoie un bool.
+        """
+        val = self.read()  # lit la valeur physique de la GPIO
+        # Si pull-up : bouton appuyé = 0 (low), relâché = 1 (high)
+        if self.pull == Pull.UP:
+            return val == 0
+        # Si pull-down : bouton appuyé = 1 (high), relâché = 0 (low)
+        elif self.pull == Pull.DOWN:
+            return val == 1
+        # Aucun pull : on renvoie simplement l'état tel quel
+        else:
+            return bool(val)
 
 
     # --- Méthodes non bloquantes ---
@@ -43,7 +54,7 @@ class Button(PinIn):
         if self.when_pressed:
             self.when_pressed()
 
-    def release(self):
+    def _fire_release(self):
         if self.when_released:
             self.when_released()
 
@@ -57,14 +68,16 @@ class Button(PinIn):
 
     def hold(self, duration=1):
         """Callback si le bouton est maintenu appuyé pendant 'duration' secondes"""
-        if self.is_pressed():
-            start = time.time()
-            while self.is_pressed():
-                if time.time() - start >= duration:
-                    if self.when_held:
-                        self.when_held()
-                    break
-                time.sleep(0.005)
+        # Dort sur les fronts gpiod jusqu'à l'échéance au lieu de relire
+        # la broche toutes les 5 ms.
+        deadline_ns = time.monotonic_ns() + int(duration * 1e9)
+        while self.is_pressed():
+            remaining_ns = deadline_ns - time.monotonic_ns()
+            if remaining_ns <= 0:
+                if self.when_held:
+                    self.when_held()
+                break
+            self.wait_for_edge(timeout=min(0.2, remaining_ns / 1e9))
 
     def stop(self):
         """Arrête le thread non bloquant"""
@@ -73,20 +86,21 @@ class Button(PinIn):
     def close(self):
         """Arrête le thread et libère les GPIO"""
         self.stop()
-        # release ou restore si nécessaire
-        self.release()  # relâche le bouton avant fermeture
+        self._thread.join(timeout=1.0)
         super().close()  # utilise PinIn.close()
 
     # --- Méthodes bloquantes ---
     def wait_for_press(self):
+        # Sommeil noyau jusqu'au front : aucune scrutation.
         while not self.is_pressed():
-            time.sleep(0.005)
+            self.wait_for_edge(timeout=0.2)
         self.press()
 
     def wait_for_release(self):
+        # Sommeil noyau jusqu'au front : aucune scrutation.
         while self.is_pressed():
-            time.sleep(0.005)
-        self.release()
+            self.wait_for_edge(timeout=0.2)
+        self._fire_release()
 
     def wait_for_click(self):
         self.wait_for_press()
@@ -95,26 +109,76 @@ class Button(PinIn):
 
     # --- Méthodes internes ---
     def _monitor(self):
-        """Thread interne pour détecter les événements non bloquants"""
+        """
+        Thread interne : machine à états pilotée par les fronts gpiod.
+
+        IDLE -> PRESSED sur appui ; PRESSED -> HELD après hold_time
+        (when_held) ; PRESSED -> WAIT_2ND sur relâchement rapide ;
+        WAIT_2ND -> PRESSED sur second appui (when_double_clicked) ou
+        retour en IDLE à l'expiration de double_click_time (when_clicked).
+        Aucune scrutation ni sleep imbriqué : le thread dort sur les
+        fronts, borné par l'échéance monotonic_ns de l'état courant, et
+        le debounce est une simple comparaison d'horodatages.
+        """
+        # Debounce : filtré par le noyau en gpiod v2, par horodatage sinon.
+        debounce_ns = 0 if is_gpiod_v2() else int(self.debounce_time * 1e9)
+        dbl_ns = int(self.double_click_time * 1e9)
+        hold_ns = int(self.hold_time * 1e9)
+        state = self._IDLE
+        deadline_ns = None  # échéance du timeout de l'état courant
+        last_edge_ns = 0
+        second_press = False  # l'appui courant a déjà consommé un double-clic
+
         while self._running:
-            state = self.is_pressed()
-            if state != self._last_state:
-                time.sleep(self.debounce_time)  # debounce
-                state = self.is_pressed()
-                if state != self._last_state:
-                    if state:
-                        self._on_press()
+            if deadline_ns is None:
+                timeout = 0.2
+            else:
+                timeout = max(0.0, min(0.2, (deadline_ns - time.monotonic_ns()) / 1e9))
+            got_edge = self.wait_for_edge(timeout=timeout)
+            now = time.monotonic_ns()
+
+            if got_edge:
+                pressed = self.is_pressed()
+                if pressed == self._last_state or now - last_edge_ns < debounce_ns:
+                    continue  # rebond ou front redondant : ignoré
+                last_edge_ns = now
+                self._last_state = pressed
+                if pressed:
+                    self._on_press()
+                    second_press = state == self._WAIT_2ND
+                    if second_press:
+                        self.double_click()
+                    state = self._PRESSED
+                    deadline_ns = now + hold_ns
+                else:
+                    self._on_release()
+                    if state == self._PRESSED and not second_press:
+                        # Candidat clic : attend un éventuel second appui
+                        state = self._WAIT_2ND
+                        deadline_ns = now + dbl_ns
                     else:
-                        self._on_release()
-                    self._last_state = state
-            time.sleep(0.005)
+                        # Relâchement d'un second appui (double-clic déjà
+                        # émis) ou d'un maintien : cycle terminé.
+                        state = self._IDLE
+                        deadline_ns = None
+                continue
+
+            # Pas de front : échéance de l'état courant atteinte ?
+            if deadline_ns is not None and now >= deadline_ns:
+                if state == self._PRESSED:
+                    state = self._HELD
+                    deadline_ns = None
+                    if self.when_held:
+                        self.when_held()
+                elif state == self._WAIT_2ND:
+                    state = self._IDLE
+                    deadline_ns = None
+                    self.click()
 
     def _on_press(self):
         self.press()
-        # Ici on pourrait ajouter click/double_click/hold non bloquant
 
     def _on_release(self):
-        self.release()
-        # Ici on pourrait ajouter click/double_click non bloquant
+        self._fire_release()
 if __name__ == "__main__":
     print("Ce module ne doit pas être exécuté directement.")   
\ No newline at end of file
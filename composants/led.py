@@ -1,4 +1,4 @@
-from .base import PinOut
+from ..base.base import PinOut
 import time
 import threading
 
@@ -12,6 +12,9 @@ class LED(PinOut):
         super().__init__(pin, chip="gpiochip0")
         self.__blink_thread = None
         self.__blinking = False
+        # Signal d'arrêt coopératif : off() interrompt le sleep en cours
+        # au lieu d'attendre la fin de l'intervalle.
+        self.__blink_stop = threading.Event()
     
     def on(self):
         """
@@ -36,6 +39,7 @@ class LED(PinOut):
             None
         """
         self.__blinking = False
+        self.__blink_stop.set()
         super().write(0)
         
     def toggle(self):
@@ -67,13 +71,14 @@ class LED(PinOut):
         def _blink():
             """Fonction interne pour clignoter."""
             self.__blinking = True
+            self.__blink_stop.clear()
             for _ in range(count):
-                if not self.__blinking:
-                    break
                 self.write(1)
-                time.sleep(interval)
+                if self.__blink_stop.wait(interval):
+                    break
                 self.write(0)
-                time.sleep(interval)
+                if self.__blink_stop.wait(interval):
+                    break
             self.__blinking = False
 
         self.__blink_thread = threading.Thread(target=_blink, daemon=True)
@@ -97,12 +102,15 @@ class LED(PinOut):
         def _blink_times():
             """Fonction interne pour clignoter pendant une durée."""
             self.__blinking = True
+            self.__blink_stop.clear()
             end_time = time.time() + seconds
-            while self.__blinking and time.time() < end_time:
+            while time.time() < end_time:
                 self.write(1)
-                time.sleep(interval)
+                if self.__blink_stop.wait(interval):
+                    break
                 self.write(0)
-                time.sleep(interval)
+                if self.__blink_stop.wait(interval):
+                    break
             self.__blinking = False
 
         self.__blink_thread = threading.Thread(target=_blink_times, daemon=True)
@@ -1,14 +1,16 @@
 import time
 import threading
-import random
-from .base import PWM
+from ..base.pinbus import PinBus
+from ..base.pwm_scheduler import PWMScheduler
 
 
 class LEDRGB:
     """
-    Classe LED RGB basée sur 3 sorties PWM.
-    
-    - Fréquence commune aux 3 LEDs
+    Classe LED RGB basée sur un PWM logiciel commun aux 3 canaux.
+
+    - Les trois broches sont réservées par une seule requête gpiod
+    - Chaque front PWM écrit les trois lignes en un seul appel set_values
+      (1 ioctl au lieu de 3), ce qui garde les canaux alignés entre eux
     - Duty cycle interne en 16 bits (non exposé)
     - Valeurs utilisateur en float (0.0 → 1.0)
     """
@@ -25,24 +27,44 @@ class LEDRGB:
             frequency (int): Fréquence PWM commune (Hz)
         """
         self._frequency = frequency
+        self._pins = (red_pin, green_pin, blue_pin)
+        self._chip_name = chip
 
-        # PWM internes (16 bits uniquement)
-        self._red = PWM(red_pin, chip=chip, frequency=frequency)
-        self._green = PWM(green_pin, chip=chip, frequency=frequency)
-        self._blue = PWM(blue_pin, chip=chip, frequency=frequency)
-
-        # Toujours en 16 bits
-        self._red.duty_cycle_16(0)
-        self._green.duty_cycle_16(0)
-        self._blue.duty_cycle_16(0)
+        # Une seule requête gpiod couvrant les trois broches, et un seul
+        # thread ordonnanceur pour les trois canaux PWM.
+        self._bus = PinBus(self._pins, chip=chip)
+        self._scheduler = PWMScheduler(self._bus)
 
-        # Couleur actuelle (float 0 → 1)
-        self._color = (0.0, 0.0, 0.0)
+        # Couleur courante : les trois duty cycles 16 bits empaquetés dans
+        # un seul mot (rouge << 32 | vert << 16 | bleu). Un entier unique
+        # se met à jour atomiquement (pas de tuple déchiré vu d'un autre
+        # thread) et se lit d'un bloc par le thread PWM.
+        self._packed = 0
 
         self._blinking = False
         self._blink_thread = None
+        # Signal d'arrêt coopératif : off() et close() interrompent le
+        # sleep en cours au lieu d'attendre la fin de l'intervalle.
+        self._blink_stop = threading.Event()
+
+    def _start(self):
+        """
+        Pousse les duty cycles courants vers l'ordonnanceur partagé et
+        le démarre s'il ne tourne pas déjà.
+
+        Arguments:
+            None
+
+        Returns:
+            None
+        """
+        period_ns = int(1e9 / self._frequency)
+        packed = self._packed
+        for pin, shift in zip(self._pins, (32, 16, 0)):
+            duty = (packed >> shift) & 0xFFFF
+            self._scheduler.set_channel(pin, period_ns, (period_ns * duty) >> 16)
+        self._scheduler.start()
 
-    
     def frequency(self, value: int | None = None) -> int:
         """
         Getter / Setter de la fréquence PWM commune.
@@ -63,9 +85,8 @@ class LEDRGB:
             raise ValueError("La fréquence doit être > 0 Hz")
 
         self._frequency = value
-
-        for pwm in (self._red, self._green, self._blue):
-            pwm.frequency = value
+        if self._scheduler.running:
+            self._start()
 
         return self._frequency
 
@@ -78,19 +99,13 @@ class LEDRGB:
             g (float): Vert (0.0 → 1.0)
             b (float): Bleu (0.0 → 1.0)
         """
-        r = max(0.0, min(1.0, r))
-        g = max(0.0, min(1.0, g))
-        b = max(0.0, min(1.0, b))
+        # Clamp + quantification des trois canaux en une seule expression
+        # entière, directement sous forme empaquetée.
+        self._packed = ((max(0, min(65535, int(r * 65535))) << 32)
+                        | (max(0, min(65535, int(g * 65535))) << 16)
+                        | max(0, min(65535, int(b * 65535))))
 
-        self._color = (r, g, b)
-
-        self._red.duty_cycle_16(int(r * 65535))
-        self._green.duty_cycle_16(int(g * 65535))
-        self._blue.duty_cycle_16(int(b * 65535))
-
-        self._red.start()
-        self._green.start()
-        self._blue.start()
+        self._start()
 
     def color_percent(self, r: float, g: float, b: float):
         """
@@ -103,16 +118,51 @@ class LEDRGB:
         """
         self.color(r / 100.0, g / 100.0, b / 100.0)
 
-    
+    def color_array(self, colors, interval: float = 0.02):
+        """
+        Joue une suite de couleurs (animation, non bloquant).
+
+        La quantification de toutes les trames est vectorisée avec NumPy
+        avant le démarrage : la boucle d'animation n'applique plus que des
+        mots déjà empaquetés. Nécessite numpy.
+
+        Arguments:
+            colors: Tableau de forme (N, 3), floats 0.0 → 1.0
+            interval (float): Durée de chaque trame en secondes
+
+        Returns:
+            None
+        """
+        import numpy as np
+
+        if self._blinking:
+            return
+
+        arr = (np.clip(np.asarray(colors, dtype=np.float32), 0.0, 1.0)
+               * 65535).astype(np.uint16)
+        frames = [(int(r) << 32) | (int(g) << 16) | int(b) for r, g, b in arr]
+
+        def _play():
+            self._blinking = True
+            for packed in frames:
+                if not self._blinking:
+                    break
+                self._packed = packed
+                self._start()
+                time.sleep(interval)
+            self._blinking = False
+
+        self._blink_thread = threading.Thread(target=_play, daemon=True)
+        self._blink_thread.start()
+
     def off(self):
         """
         Éteint complètement la LED RGB.
         """
         self._blinking = False
+        self._blink_stop.set()
         self.color(0.0, 0.0, 0.0)
 
-   
-
     def blink(self, count: int, interval: float = 0.5):
         """
         Clignote avec la couleur actuelle (non bloquant).
@@ -126,13 +176,17 @@ class LEDRGB:
 
         def _blink():
             self._blinking = True
+            self._blink_stop.clear()
+            packed = self._packed  # couleur restaurée telle quelle, déjà quantifiée
             for _ in range(count):
-                if not self._blinking:
+                self._packed = packed
+                self._start()
+                if self._blink_stop.wait(interval):
+                    break
+                self._packed = 0
+                self._start()
+                if self._blink_stop.wait(interval):
                     break
-                self.color(*self._color)
-                time.sleep(interval)
-                self.off()
-                time.sleep(interval)
             self._blinking = False
 
         self._blink_thread = threading.Thread(target=_blink, daemon=True)
@@ -145,7 +199,7 @@ class LEDRGB:
         Arguments:
             seconds (float): Durée totale
             interval (float): Temps ON / OFF
-            
+
         Returns:
             None
         """
@@ -154,32 +208,39 @@ class LEDRGB:
 
         def _blink_times():
             self._blinking = True
+            self._blink_stop.clear()
+            packed = self._packed  # couleur restaurée telle quelle, déjà quantifiée
             end_time = time.time() + seconds
-            while self._blinking and time.time() < end_time:
-                self.color(*self._color)
-                time.sleep(interval)
-                self.off()
-                time.sleep(interval)
+            while time.time() < end_time:
+                self._packed = packed
+                self._start()
+                if self._blink_stop.wait(interval):
+                    break
+                self._packed = 0
+                self._start()
+                if self._blink_stop.wait(interval):
+                    break
             self._blinking = False
 
         self._blink_thread = threading.Thread(target=_blink_times, daemon=True)
         self._blink_thread.start()
 
-    
-
     def close(self):
         """
         Libère toutes les ressources GPIO.
-        
+
         """
         self._blinking = False
-        self._red.close()
-        self._green.close()
-        self._blue.close()
+        self._blink_stop.set()
+        self._scheduler.stop()
+        self._bus.write({pin: 0 for pin in self._pins})
+        self._bus.close()
 
-   
     def __str__(self):
-        r, g, b = self._color
+        packed = self._packed
+        r = ((packed >> 32) & 0xFFFF) / 65535
+        g = ((packed >> 16) & 0xFFFF) / 65535
+        b = (packed & 0xFFFF) / 65535
         return f"LEDRGB(R={r:.2f}, G={g:.2f}, B={b:.2f}, freq={self._frequency}Hz)"
 
     def __repr__(self):
@@ -187,9 +248,9 @@ class LEDRGB:
         R
         """
         return (
-            f"LEDRGB(red_pin={self._red.pin}, "
-            f"green_pin={self._green.pin}, "
-            f"blue_pin={self._blue.pin}, "
+            f"LEDRGB(red_pin={self._pins[0]}, "
+            f"green_pin={self._pins[1]}, "
+            f"blue_pin={self._pins[2]}, "
             f"frequency={self._frequency})"
         )
 